@@ -4,11 +4,30 @@ from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes
 
 # Enable logging
-logging.basicConfig(format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO)
+logging.basicConfig(
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=os.getenv("LOG_LEVEL", "INFO").upper()
+)
 logger = logging.getLogger(__name__)
 
 # Environment variable
 DRIVER_BOT_TOKEN = os.getenv("DRIVER_BOT_TOKEN")
+# Public host Telegram pushes updates to; without it the bot falls back to long polling.
+# Per-bot variables, so the passenger and driver bots never register the same host or bind the same port
+WEBHOOK_HOST = os.getenv("DRIVER_WEBHOOK_HOST")
+PORT = int(os.getenv("DRIVER_WEBHOOK_PORT", os.getenv("PORT", "8443")))
+# Only the update types the handlers use, so Telegram doesn't send (and PTB doesn't parse) the rest
+ALLOWED_UPDATES = [Update.MESSAGE]
+
+HELP_TEXT = (
+    "🚕 Driver Bot Help\n\n"
+    "This bot receives taxi orders automatically.\n\n"
+    "When a passenger places an order, you will receive:\n"
+    "• Customer name and phone\n"
+    "• Pickup and drop-off locations\n"
+    "• Waze navigation link\n"
+    "• Customer’s Telegram username for contact\n\n"
+    "Contact customers directly through Telegram to confirm the ride."
+)
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Start command for drivers"""
@@ -22,16 +41,7 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Help command"""
-    await update.message.reply_text(
-        "🚕 Driver Bot Help\n\n"
-        "This bot receives taxi orders automatically.\n\n"
-        "When a passenger places an order, you will receive:\n"
-        "• Customer name and phone\n"
-        "• Pickup and drop-off locations\n"
-        "• Waze navigation link\n"
-        "• Customer’s Telegram username for contact\n\n"
-        "Contact customers directly through Telegram to confirm the ride."
-    )
+    await update.message.reply_text(HELP_TEXT)
 
 def main():
     """Start the driver bot"""
@@ -39,15 +49,25 @@ def main():
         logger.error("DRIVER_BOT_TOKEN not set. Exiting.")
         return
 
-    application = Application.builder().token(DRIVER_BOT_TOKEN).build()
+    application = Application.builder().token(DRIVER_BOT_TOKEN).concurrent_updates(True).build()
 
     # Command handlers
     application.add_handler(CommandHandler("start", start))
     application.add_handler(CommandHandler("help", help_command))
 
     # Start the bot
-    logger.info("Driver bot started...")
-    application.run_polling(allowed_updates=Update.ALL_TYPES)
+    if WEBHOOK_HOST:
+        logger.info("Driver bot started (webhook on port %s)...", PORT)
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=PORT,
+            url_path=DRIVER_BOT_TOKEN,
+            webhook_url=f"https://{WEBHOOK_HOST}/{DRIVER_BOT_TOKEN}",
+            allowed_updates=ALLOWED_UPDATES,
+        )
+    else:
+        logger.info("Driver bot started (polling)...")
+        application.run_polling(allowed_updates=ALLOWED_UPDATES)
 
 if __name__ == "__main__":
     main()
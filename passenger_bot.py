@@ -1,7 +1,17 @@
 import os
 import json
+import pickle
+import asyncio
 import logging
-from typing import List
+import sqlite3
+import functools
+import time
+from collections import defaultdict
+from dataclasses import dataclass, fields as dataclass_fields
+from typing import Optional, Set, Tuple
+import orjson
+import redis.asyncio as redis
+from urllib.parse import quote
 from telegram import (
     Update,
     ReplyKeyboardMarkup,
@@ -9,7 +19,6 @@ from telegram import (
     InlineKeyboardMarkup,
     InlineKeyboardButton,
     ReplyKeyboardRemove,
-    Bot,
 )
 from telegram.ext import (
     Application,
@@ -19,17 +28,55 @@ from telegram.ext import (
     ContextTypes,
     filters,
     ConversationHandler,
+    BasePersistence,
+    PersistenceInput,
+    PicklePersistence,
+    ExtBot,
+    AIORateLimiter,
 )
+from telegram.constants import MessageLimit
+from telegram.error import BadRequest, NetworkError, RetryAfter, TelegramError
+from telegram.request import HTTPXRequest
 
-# Enable logging
+# Enable logging (LOG_LEVEL=WARNING quiets the per-order info lines in production)
 logging.basicConfig(
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=os.getenv("LOG_LEVEL", "INFO").upper()
 )
 logger = logging.getLogger(__name__)
 
 # States for conversation
 NAME, PHONE, PICKUP, DROPOFF, CONFIRM = range(5)
 
+
+@dataclass(slots=True)
+class Order:
+    """Order in progress, kept in context.user_data["order"] during the conversation"""
+
+    name: str = ""
+    phone: str = ""
+    pickup: str = ""
+    pickup_coords: Optional[Tuple[float, float]] = None
+    waze_link: str = ""
+    dropoff: str = ""
+    comment: str = ""
+    waiting_for_comment: bool = False
+    # Summary message with the inline buttons; edited in place instead of sending a new one
+    summary_message_id: Optional[int] = None
+
+    # Orders are persisted. A pickle from before a field was added holds fewer values, and slots would
+    # leave the new ones unset, so __setstate__ rebuilds through __init__ to give them their defaults
+    # (new fields must be appended at the end). The state format matches the dataclass default.
+    def __getstate__(self):
+        return [getattr(self, f.name) for f in dataclass_fields(self)]
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+
+# Waze navigation links for shared coordinates and typed addresses
+WAZE_COORDS_URL = "https://waze.com/ul?ll={lat},{lon}&navigate=yes"
+WAZE_SEARCH_URL = "https://waze.com/ul?q={query}&navigate=yes"
+
 # Language buttons
 LANG_UK = "🇺🇦 Українська"
 LANG_EN = "🇬🇧 English"
@@ -38,34 +85,309 @@ LANG_EN = "🇬🇧 English"
 PASSENGER_BOT_TOKEN = os.getenv("PASSENGER_BOT_TOKEN")
 DRIVER_BOT_TOKEN = os.getenv("DRIVER_BOT_TOKEN")
 ADMIN_USERNAME = os.getenv("ADMIN_USERNAME", "itsbarhit")
+# Comma-separated admin usernames; Telegram usernames are case-insensitive
+ADMINS = frozenset(u.strip().lower() for u in os.getenv("ADMIN_USERNAMES", ADMIN_USERNAME).split(",") if u.strip())
+# Public host Telegram pushes updates to; without it the bot falls back to long polling.
+# Per-bot variables, so the passenger and driver bots never register the same host or bind the same port
+WEBHOOK_HOST = os.getenv("PASSENGER_WEBHOOK_HOST")
+PORT = int(os.getenv("PASSENGER_WEBHOOK_PORT", os.getenv("PORT", "8443")))
+# Only the update types the handlers use, so Telegram doesn't send (and PTB doesn't parse) the rest
+ALLOWED_UPDATES = [Update.MESSAGE, Update.CALLBACK_QUERY]
+# Optional: share drivers and conversation state between replicas (and restarts) through Redis
+REDIS_URL = os.getenv("REDIS_URL")
 
 # Driver storage
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DRIVER_STORE_FILE = os.path.join(BASE_DIR, "drivers.json")
+DRIVER_DB_FILE = os.path.join(BASE_DIR, "drivers.db")
+# Older deployments kept the driver list in a JSON file; it is imported once into the database
+LEGACY_DRIVER_STORE_FILE = os.path.join(BASE_DIR, "drivers.json")
+# Without Redis, user data and conversation states are pickled here so in-progress orders survive restarts
+PERSISTENCE_FILE = os.path.join(BASE_DIR, "passenger_bot_state")
 
 
-def load_driver_ids() -> List[int]:
+def open_driver_db() -> sqlite3.Connection:
+    # autocommit mode: every INSERT/DELETE is its own tiny transaction
+    conn = sqlite3.connect(DRIVER_DB_FILE, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # in WAL mode NORMAL skips the fsync per commit; the WAL is synced at checkpoints instead
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS drivers (chat_id INTEGER PRIMARY KEY)")
+    return conn
+
+
+driver_db = open_driver_db()
+
+
+def import_legacy_driver_ids() -> None:
+    # user_version records that the import ran, so drivers removed later are not brought back from the JSON file
     try:
-        if os.path.exists(DRIVER_STORE_FILE):
-            with open(DRIVER_STORE_FILE, "r", encoding="utf-8") as f:
+        if driver_db.execute("PRAGMA user_version").fetchone()[0] >= 1:
+            return
+        try:
+            with open(LEGACY_DRIVER_STORE_FILE, "r", encoding="utf-8") as f:
                 data = json.load(f)
-                if isinstance(data, list):
-                    return [int(x) for x in data]
+        except FileNotFoundError:
+            data = []
+        # databases created before the marker existed already hold the imported drivers
+        if driver_db.execute("SELECT 1 FROM drivers LIMIT 1").fetchone():
+            data = []
+        if isinstance(data, list):
+            driver_db.executemany("INSERT OR IGNORE INTO drivers VALUES (?)", [(int(x),) for x in data])
+            if data:
+                logger.info("Imported %s driver ids from %s", len(data), LEGACY_DRIVER_STORE_FILE)
+        driver_db.execute("PRAGMA user_version = 1")
     except Exception as e:
-        logger.error(f"Failed to load driver ids from {DRIVER_STORE_FILE}: {e}")
-    return []
+        logger.error("Failed to import driver ids from %s: %s", LEGACY_DRIVER_STORE_FILE, e)
 
 
-def save_driver_ids(ids: List[int]) -> None:
+def load_driver_ids() -> Set[int]:
     try:
-        with open(DRIVER_STORE_FILE, "w", encoding="utf-8") as f:
-            json.dump(ids, f)
+        return {row[0] for row in driver_db.execute("SELECT chat_id FROM drivers")}
     except Exception as e:
-        logger.error(f"Failed to save driver ids to {DRIVER_STORE_FILE}: {e}")
+        logger.error("Failed to load driver ids from %s: %s", DRIVER_DB_FILE, e)
+    return set()
+
+
+def insert_driver_id(chat_id: int) -> None:
+    try:
+        driver_db.execute("INSERT OR IGNORE INTO drivers VALUES (?)", (chat_id,))
+    except Exception as e:
+        logger.error("Failed to save driver %s to %s: %s", chat_id, DRIVER_DB_FILE, e)
+
+
+def delete_driver_id(chat_id: int) -> None:
+    try:
+        driver_db.execute("DELETE FROM drivers WHERE chat_id = ?", (chat_id,))
+    except Exception as e:
+        logger.error("Failed to delete driver %s from %s: %s", chat_id, DRIVER_DB_FILE, e)
+
+
+# Storage for driver chat IDs (persistent); a set keeps admin add/remove checks O(1)
+import_legacy_driver_ids()
+driver_chat_ids: Set[int] = load_driver_ids()
+
+# Caps how many order sends to drivers are in flight at once, and how many go out per second
+# (Telegram allows ~30 msg/s per bot)
+DRIVER_SEND_CONCURRENCY = 25
+DRIVER_SEND_RATE = 25
+driver_send_semaphore = asyncio.Semaphore(DRIVER_SEND_CONCURRENCY)
+# Flood-control (429) and network errors are retried; anything else fails the delivery right away
+DRIVER_SEND_ATTEMPTS = 2
+# Updates run concurrently, so check-then-write on driver_chat_ids is serialized with this lock
+driver_ids_lock = asyncio.Lock()
+# Rendered /list_drivers body; reset to None whenever driver_chat_ids changes
+drivers_list_cache: Optional[str] = None
+
+
+def drivers_list_text() -> str:
+    global drivers_list_cache
+    if drivers_list_cache is None:
+        drivers_list_cache = "\n".join(f"• {chat_id}" for chat_id in sorted(driver_chat_ids))
+    return drivers_list_cache
+
+
+# With REDIS_URL set, the Redis set is the stored driver list; it is loaded into driver_chat_ids once at
+# startup and then kept in step by add/remove (a single passenger bot instance owns it)
+REDIS_DRIVERS_KEY = "taxi:drivers"
+REDIS_ADMIN_CHAT_KEY = "taxi:admin_chat_id"
+# Set once the local drivers have been copied to Redis; the drivers set itself vanishes when it becomes empty
+REDIS_DRIVERS_MIGRATED_KEY = "taxi:drivers_migrated"
+redis_client = redis.from_url(REDIS_URL) if REDIS_URL else None
+
+
+async def load_redis_driver_ids() -> None:
+    """Load driver ids from Redis into driver_chat_ids (no-op without Redis)"""
+    global drivers_list_cache
+    if redis_client is None:
+        return
+    try:
+        members = await redis_client.smembers(REDIS_DRIVERS_KEY)
+    except Exception as e:
+        logger.error("Failed to load driver ids from Redis: %s", e)
+        return
+    ids = {int(x) for x in members}
+    async with driver_ids_lock:
+        if ids != driver_chat_ids:
+            driver_chat_ids.clear()
+            driver_chat_ids.update(ids)
+            drivers_list_cache = None
+
+
+async def store_driver_id(chat_id: int) -> None:
+    if redis_client is None:
+        # single-row write, off the event loop
+        await asyncio.to_thread(insert_driver_id, chat_id)
+        return
+    try:
+        await redis_client.sadd(REDIS_DRIVERS_KEY, chat_id)
+    except Exception as e:
+        logger.error("Failed to save driver %s to Redis: %s", chat_id, e)
+
+
+async def drop_driver_id(chat_id: int) -> None:
+    if redis_client is None:
+        await asyncio.to_thread(delete_driver_id, chat_id)
+        return
+    try:
+        await redis_client.srem(REDIS_DRIVERS_KEY, chat_id)
+    except Exception as e:
+        logger.error("Failed to delete driver %s from Redis: %s", chat_id, e)
+
+
+async def store_admin_chat_id(chat_id: int) -> None:
+    """Remember where to send admin notifications across restarts (no-op without Redis)"""
+    if redis_client is None:
+        return
+    try:
+        await redis_client.set(REDIS_ADMIN_CHAT_KEY, chat_id)
+    except Exception as e:
+        logger.error("Failed to save admin chat id to Redis: %s", e)
+
+
+class RedisPersistence(BasePersistence):
+    """Keep user_data, chat_data and conversation states in Redis hashes.
+
+    bot_data is not persisted: it holds live objects (the driver bot) that main() recreates.
+    """
+
+    def __init__(self, client: redis.Redis, prefix: str = "taxi", update_interval: float = 10):
+        super().__init__(store_data=PersistenceInput(bot_data=False, callback_data=False), update_interval=update_interval)
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, name: str) -> str:
+        return f"{self.prefix}:{name}"
+
+    async def get_user_data(self):
+        data = await self.client.hgetall(self._key("user_data"))
+        return {int(k): pickle.loads(v) for k, v in data.items()}
+
+    async def update_user_data(self, user_id, data):
+        await self.client.hset(self._key("user_data"), str(user_id), pickle.dumps(data))
+
+    async def drop_user_data(self, user_id):
+        await self.client.hdel(self._key("user_data"), str(user_id))
+
+    async def refresh_user_data(self, user_id, user_data):
+        pass
+
+    async def get_chat_data(self):
+        data = await self.client.hgetall(self._key("chat_data"))
+        return {int(k): pickle.loads(v) for k, v in data.items()}
+
+    async def update_chat_data(self, chat_id, data):
+        await self.client.hset(self._key("chat_data"), str(chat_id), pickle.dumps(data))
 
+    async def drop_chat_data(self, chat_id):
+        await self.client.hdel(self._key("chat_data"), str(chat_id))
+
+    async def refresh_chat_data(self, chat_id, chat_data):
+        pass
+
+    async def get_bot_data(self):
+        return {}
+
+    async def update_bot_data(self, data):
+        pass
+
+    async def refresh_bot_data(self, bot_data):
+        pass
+
+    async def get_callback_data(self):
+        return None
+
+    async def update_callback_data(self, data):
+        pass
+
+    async def get_conversations(self, name):
+        data = await self.client.hgetall(self._key(f"conversations:{name}"))
+        return {tuple(json.loads(k)): json.loads(v) for k, v in data.items()}
+
+    async def update_conversation(self, name, key, new_state):
+        conversations_key = self._key(f"conversations:{name}")
+        if new_state is None:
+            await self.client.hdel(conversations_key, json.dumps(key))
+        else:
+            await self.client.hset(conversations_key, json.dumps(key), json.dumps(new_state))
+
+    async def flush(self):
+        pass
+
+
+class ThreadedPicklePersistence(PicklePersistence):
+    """PicklePersistence that writes its file from a worker thread, once per batch of changes.
+
+    The stock class re-pickles the data of every user on the event loop for each changed user or
+    conversation. Here the update methods only change memory (on_flush=True) and schedule one
+    background write of a snapshot.
+    """
+
+    def __init__(self, filepath: str, update_interval: float = 10):
+        super().__init__(
+            filepath=filepath,
+            store_data=PersistenceInput(bot_data=False, callback_data=False),
+            on_flush=True,
+            update_interval=update_interval,
+        )
+        self._dirty = False
+        self._write_task: Optional[asyncio.Task] = None
+
+    def _schedule_write(self) -> None:
+        self._dirty = True
+        if self._write_task is None or self._write_task.done():
+            self._write_task = asyncio.create_task(self._write_pending())
+
+    async def _write_pending(self) -> None:
+        # Changes made while a write is running are picked up by the next loop iteration
+        while self._dirty:
+            self._dirty = False
+            await asyncio.to_thread(self._write_snapshot, self._snapshot())
+
+    def _snapshot(self) -> dict:
+        # Shallow copies are enough: the Application hands over deep copies and replaces them on change
+        return {
+            "conversations": {name: dict(states) for name, states in (self.conversations or {}).items()},
+            "user_data": dict(self.user_data or {}),
+            "chat_data": dict(self.chat_data or {}),
+        }
+
+    def _write_snapshot(self, snapshot: dict) -> None:
+        tmp_path = f"{self.filepath}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # replace in one step so a crash mid-write never leaves a truncated state file
+            os.replace(tmp_path, self.filepath)
+        except Exception as e:
+            logger.error("Failed to save bot state to %s: %s", self.filepath, e)
+
+    async def update_user_data(self, user_id, data):
+        await super().update_user_data(user_id, data)
+        self._schedule_write()
+
+    async def drop_user_data(self, user_id):
+        await super().drop_user_data(user_id)
+        self._schedule_write()
+
+    async def update_chat_data(self, chat_id, data):
+        await super().update_chat_data(chat_id, data)
+        self._schedule_write()
+
+    async def drop_chat_data(self, chat_id):
+        await super().drop_chat_data(chat_id)
+        self._schedule_write()
+
+    async def update_conversation(self, name, key, new_state):
+        await super().update_conversation(name, key, new_state)
+        self._schedule_write()
+
+    async def flush(self):
+        # Let a running background write finish, then save the final state once
+        if self._write_task is not None:
+            await self._write_task
+        self._dirty = False
+        await asyncio.to_thread(self._write_snapshot, self._snapshot())
 
-# Storage for driver chat IDs (persistent)
-driver_chat_ids = load_driver_ids()
 
 # Simple translation dictionary for passenger-facing messages
 TRANSLATIONS = {
@@ -100,6 +422,7 @@ TRANSLATIONS = {
         "add_comment_prompt": "Please enter your comment:",
         "order_delivery_failed": "⚠️ ORDER DELIVERY FAILED\n\nCustomer: {customer}\nFailed to deliver to {count} driver(s)",
         "cancelled": "Order cancelled. Press the button to start a new order.",
+        "rate_limited": "⏳ Too many requests. Please wait a moment and try again.",
         "not_authorized": "⛔ You are not authorized to use this command.",
         "add_driver_usage": "Usage: /add_driver CHAT_ID",
         "remove_driver_usage": "Usage: /remove_driver CHAT_ID",
@@ -140,6 +463,7 @@ TRANSLATIONS = {
         "add_comment_prompt": "Будь ласка, введіть ваш коментар:",
         "order_delivery_failed": "⚠️ ДОСТАВКА ЗАМОВЛЕННЯ НЕ УДАЛАСЯ\n\nКлієнт: {customer}\nНе вдалося доставити {count} водію(ям)",
         "cancelled": "Замовлення скасовано. Натисніть кнопку щоб почати нове замовлення.",
+        "rate_limited": "⏳ Забагато запитів. Зачекайте трохи та спробуйте знову.",
         "not_authorized": "⛔ У вас немає доступу до цієї команди.",
         "add_driver_usage": "Використання: /add_driver CHAT_ID",
         "remove_driver_usage": "Використання: /remove_driver CHAT_ID",
@@ -154,22 +478,177 @@ TRANSLATIONS = {
 }
 
 
+def build_summary_template(lang: str) -> str:
+    """Order summary with labels filled in; only the order fields are left as {placeholders}."""
+    t = TRANSLATIONS[lang]
+    return (
+        f"{t['order_summary_title']}"
+        f"{t['name_label']}: {{name}}\n"
+        f"{t['phone_label']}: {{phone}}\n"
+        f"{t['pickup_label']}: {{pickup}}\n"
+        f"{t['dropoff_label']}: {{dropoff}}\n"
+        "{comment_line}"
+    )
+
+
+def build_order_template(lang: str) -> str:
+    """Driver order message with labels filled in; only the order fields are left as {placeholders}."""
+    t = TRANSLATIONS[lang]
+    return (
+        "🚖 NEW ORDER\n\n"
+        f"{t['name_label']}: {{name}}\n"
+        f"{t['phone_label']}: {{phone}}\n"
+        f"{t['pickup_label']}: {{pickup}}\n"
+        f"{t['dropoff_label']}: {{dropoff}}\n"
+        "{comment_line}\n"
+        f"{t['waze_label']}: {{waze_link}}\n"
+        "{contact_line}"
+    )
+
+
+# Message templates are built once per language; handlers only call format_map
+SUMMARY_TEMPLATES = {lang: build_summary_template(lang) for lang in TRANSLATIONS}
+ORDER_TEMPLATES = {lang: build_order_template(lang) for lang in TRANSLATIONS}
+
+
+def current_order(context: ContextTypes.DEFAULT_TYPE) -> Order:
+    """The user's order in progress (created on first access)."""
+    return context.user_data.setdefault("order", Order())
+
+
+def order_fields(context: ContextTypes.DEFAULT_TYPE, order: Optional[Order] = None) -> dict:
+    """Values for the summary/order templates from the given order (default: the user's order in progress)."""
+    if order is None:
+        order = current_order(context)
+    return {
+        "name": order.name,
+        "phone": order.phone,
+        "pickup": order.pickup,
+        "dropoff": order.dropoff,
+        "waze_link": order.waze_link,
+        "comment_line": f"{tr(context, 'comment_label')}: {order.comment}\n" if order.comment else "",
+    }
+
+
+def render_summary(context: ContextTypes.DEFAULT_TYPE) -> str:
+    """Order summary shown to the passenger in their language."""
+    lang = context.user_data.get("lang", "en")
+    return SUMMARY_TEMPLATES.get(lang, SUMMARY_TEMPLATES["en"]).format_map(order_fields(context))
+
+
+def build_markups(lang: str) -> dict:
+    """Build the keyboards for one language (Telegram objects are immutable, so they can be shared)."""
+    t = TRANSLATIONS[lang]
+    confirm_button = InlineKeyboardButton(t["confirm_button"], callback_data="confirm")
+    return {
+        "order": ReplyKeyboardMarkup([[KeyboardButton(t["order_button"])]], resize_keyboard=True),
+        "order_once": ReplyKeyboardMarkup(
+            [[KeyboardButton(t["order_button"])]], resize_keyboard=True, one_time_keyboard=True
+        ),
+        "share_contact": ReplyKeyboardMarkup(
+            [[KeyboardButton(t["share_contact_button"], request_contact=True)]],
+            resize_keyboard=True,
+            one_time_keyboard=True,
+        ),
+        "send_location": ReplyKeyboardMarkup(
+            [[KeyboardButton(t["send_location_button"], request_location=True)]],
+            resize_keyboard=True,
+            one_time_keyboard=True,
+        ),
+        "confirm_or_comment": InlineKeyboardMarkup(
+            [[confirm_button], [InlineKeyboardButton(t["add_comment_button"], callback_data="add_comment")]]
+        ),
+        "confirm": InlineKeyboardMarkup([[confirm_button]]),
+    }
+
+
+# Labels of the order button in every language, matched by the conversation entry point
+ORDER_BUTTON_TEXTS = [t["order_button"] for t in TRANSLATIONS.values()]
+
+# Keyboards are built once at import instead of on every handler call
+MARKUPS = {lang: build_markups(lang) for lang in TRANSLATIONS}
+LANGUAGE_MARKUP = ReplyKeyboardMarkup(
+    [[KeyboardButton(LANG_UK), KeyboardButton(LANG_EN)]], resize_keyboard=True, one_time_keyboard=True
+)
+REMOVE_KEYBOARD = ReplyKeyboardRemove()
+
+
+def markup(context: ContextTypes.DEFAULT_TYPE, name: str):
+    """Prebuilt keyboard in user's selected language, fallback to English."""
+    return MARKUPS.get(context.user_data.get("lang", "en"), MARKUPS["en"])[name]
+
+
+# Flat (lang, key) -> text table so tr() needs a single lookup
+TRANSLATION_TABLE = {(lang, key): text for lang, texts in TRANSLATIONS.items() for key, text in texts.items()}
+
+
 def tr(context: ContextTypes.DEFAULT_TYPE, key: str, **kwargs) -> str:
     """Translate by user's selected language, fallback to English."""
-    lang = context.user_data.get("lang", "en")
-    text = TRANSLATIONS.get(lang, TRANSLATIONS["en"]).get(key, TRANSLATIONS["en"].get(key, ""))
+    text = TRANSLATION_TABLE.get((context.user_data.get("lang", "en"), key)) or TRANSLATIONS["en"].get(key, "")
+    if not kwargs:
+        return text
     try:
-        return text.format(**kwargs)
-    except Exception:
+        return text.format_map(kwargs)
+    except KeyError:
         return text
 
 
+# Per-user token bucket for conversation entry points: bursts of up to RATE_LIMIT_BURST,
+# then one new request every RATE_LIMIT_REFILL_SECONDS
+RATE_LIMIT_BURST = 5
+RATE_LIMIT_REFILL_SECONDS = 12.0
+rate_buckets = defaultdict(lambda: [RATE_LIMIT_BURST, time.monotonic()])
+# A bucket left alone this long is full again, so it can be dropped and recreated on demand
+RATE_LIMIT_IDLE_SECONDS = RATE_LIMIT_BURST * RATE_LIMIT_REFILL_SECONDS
+rate_buckets_pruned_at = time.monotonic()
+
+
+def prune_rate_buckets(now: float) -> None:
+    """Forget idle users so rate_buckets does not grow with every user ever seen (at most once per idle period)"""
+    global rate_buckets_pruned_at
+    if now - rate_buckets_pruned_at < RATE_LIMIT_IDLE_SECONDS:
+        return
+    rate_buckets_pruned_at = now
+    for user_id in [u for u, bucket in rate_buckets.items() if now - bucket[1] >= RATE_LIMIT_IDLE_SECONDS]:
+        del rate_buckets[user_id]
+
+
+def rate_limited(handler):
+    """Drop the update with a short reply when the user has run out of tokens"""
+
+    @functools.wraps(handler)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        now = time.monotonic()
+        prune_rate_buckets(now)
+        bucket = rate_buckets[update.effective_user.id]
+        tokens = min(RATE_LIMIT_BURST, bucket[0] + (now - bucket[1]) / RATE_LIMIT_REFILL_SECONDS)
+        if tokens < 1:
+            await update.message.reply_text(tr(context, "rate_limited"))
+            return None
+        bucket[0] = tokens - 1
+        bucket[1] = now
+        return await handler(update, context)
+
+    return wrapper
+
+
+def reset_order(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Clear the user's data but keep their language"""
+    lang = context.user_data.get("lang", "en")
+    context.user_data.clear()
+    context.user_data["lang"] = lang
+
+
+async def send_start_again(chat_id: int, context: ContextTypes.DEFAULT_TYPE, prompt_key: str = "start_again"):
+    """Send a short prompt with the order button in the user's language"""
+    await context.bot.send_message(chat_id=chat_id, text=tr(context, prompt_key), reply_markup=markup(context, "order"))
+
+
+@rate_limited
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Start command - ask for language selection first"""
-    keyboard = [[KeyboardButton(LANG_UK), KeyboardButton(LANG_EN)]]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
     # Show the requested Ukrainian-only initial message (no "select language" text)
-    await update.message.reply_text("Ласкаво просимо до сервісу AllNight Taxi! 🚕", reply_markup=reply_markup)
+    await update.message.reply_text("Ласкаво просимо до сервісу AllNight Taxi! 🚕", reply_markup=LANGUAGE_MARKUP)
     return ConversationHandler.END
 
 
@@ -186,103 +665,74 @@ async def language_select(update: Update, context: ContextTypes.DEFAULT_TYPE):
         context.user_data["lang"] = "uk"
         # Proceed directly to the order flow (ask for name)
         return await order_taxi(update, context)
-    elif text == LANG_EN:
-        # User selected English: set language and show localized welcome + order button
-        context.user_data["lang"] = "en"
-        order_btn = tr(context, "order_button")
-        keyboard = [[KeyboardButton(order_btn)]]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
-        await update.message.reply_text(tr(context, "welcome"), reply_markup=reply_markup)
-        return ConversationHandler.END
-    else:
-        # unknown input: treat as english and show order button
-        context.user_data["lang"] = "en"
-        order_btn = tr(context, "order_button")
-        keyboard = [[KeyboardButton(order_btn)]]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
-        await update.message.reply_text(tr(context, "welcome"), reply_markup=reply_markup)
-        return ConversationHandler.END
+    # User selected English (unknown input is treated as English too): show localized welcome + order button
+    context.user_data["lang"] = "en"
+    await update.message.reply_text(tr(context, "welcome"), reply_markup=markup(context, "order_once"))
+    return ConversationHandler.END
 
 
+@rate_limited
 async def order_taxi(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Start the order process"""
     # ensure language is set; if not, default to english
     if "lang" not in context.user_data:
         context.user_data["lang"] = "en"
+    context.user_data["order"] = Order()
 
-    await update.message.reply_text(tr(context, "ask_name"), reply_markup=ReplyKeyboardRemove())
+    await update.message.reply_text(tr(context, "ask_name"), reply_markup=REMOVE_KEYBOARD)
     return NAME
 
 
 async def get_name(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Store name and ask for phone"""
-    context.user_data["name"] = update.message.text
+    current_order(context).name = update.message.text
 
     # Keyboard with share contact button (localized label)
-    contact_label = tr(context, "share_contact_button")
-    keyboard = [[KeyboardButton(contact_label, request_contact=True)]]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
-
-    await update.message.reply_text(tr(context, "share_phone_prompt"), reply_markup=reply_markup)
+    await update.message.reply_text(tr(context, "share_phone_prompt"), reply_markup=markup(context, "share_contact"))
     return PHONE
 
 
 async def get_phone(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Store phone and ask for pickup location"""
+    order = current_order(context)
     if update.message.contact:
-        context.user_data["phone"] = update.message.contact.phone_number
+        order.phone = update.message.contact.phone_number
     else:
-        context.user_data["phone"] = update.message.text
+        order.phone = update.message.text
 
     # Keyboard with location button (localized label)
-    location_label = tr(context, "send_location_button")
-    keyboard = [[KeyboardButton(location_label, request_location=True)]]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
-
-    await update.message.reply_text(tr(context, "send_pickup_prompt"), reply_markup=reply_markup)
+    await update.message.reply_text(tr(context, "send_pickup_prompt"), reply_markup=markup(context, "send_location"))
     return PICKUP
 
 
 async def get_pickup(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Store pickup location and ask for dropoff"""
+    order = current_order(context)
     if update.message.location:
         lat = update.message.location.latitude
         lon = update.message.location.longitude
-        context.user_data["pickup"] = f"📍 Location: {lat}, {lon}"
-        context.user_data["pickup_coords"] = (lat, lon)
-        context.user_data["waze_link"] = f"https://waze.com/ul?ll={lat},{lon}&navigate=yes"
+        order.pickup = f"📍 Location: {lat}, {lon}"
+        order.pickup_coords = (lat, lon)
+        order.waze_link = WAZE_COORDS_URL.format(lat=lat, lon=lon)
     else:
-        context.user_data["pickup"] = update.message.text
-        context.user_data["pickup_coords"] = None
-        # Create Waze link with address
-        address = update.message.text.replace(" ", "%20")
-        context.user_data["waze_link"] = f"https://waze.com/ul?q={address}&navigate=yes"
+        order.pickup = update.message.text
+        order.pickup_coords = None
+        # Create Waze link with the address percent-encoded (handles &, ?, #, non-ASCII)
+        order.waze_link = WAZE_SEARCH_URL.format(query=quote(update.message.text, safe=""))
 
-    await update.message.reply_text(tr(context, "ask_dropoff"), reply_markup=ReplyKeyboardRemove())
+    await update.message.reply_text(tr(context, "ask_dropoff"), reply_markup=REMOVE_KEYBOARD)
     return DROPOFF
 
 
 async def get_dropoff(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Store dropoff and show confirmation"""
-    context.user_data["dropoff"] = update.message.text
-    context.user_data["comment"] = ""
+    order = current_order(context)
+    order.dropoff = update.message.text
+    order.comment = ""
 
     # Show summary with confirm and add comment buttons (localized labels)
-    summary = (
-        f"{tr(context, 'order_summary_title')}"
-        f"{tr(context, 'name_label')}: {context.user_data['name']}\n"
-        f"{tr(context, 'phone_label')}: {context.user_data['phone']}\n"
-        f"{tr(context, 'pickup_label')}: {context.user_data['pickup']}\n"
-        f"{tr(context, 'dropoff_label')}: {context.user_data['dropoff']}\n"
-    )
-
-    keyboard = [
-        [InlineKeyboardButton(tr(context, "confirm_button"), callback_data="confirm")],
-        [InlineKeyboardButton(tr(context, "add_comment_button"), callback_data="add_comment")],
-    ]
-    reply_markup = InlineKeyboardMarkup(keyboard)
-
-    await update.message.reply_text(summary, reply_markup=reply_markup)
+    message = await update.message.reply_text(render_summary(context), reply_markup=markup(context, "confirm_or_comment"))
+    order.summary_message_id = message.message_id
     return CONFIRM
 
 
@@ -291,64 +741,61 @@ async def add_comment(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     await query.answer()
     await query.edit_message_text(tr(context, "add_comment_prompt"))
-    context.user_data["waiting_for_comment"] = True
+    current_order(context).waiting_for_comment = True
     return CONFIRM
 
 
 async def receive_comment(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Receive comment and show updated summary"""
-    if context.user_data.get("waiting_for_comment"):
-        context.user_data["comment"] = update.message.text
-        context.user_data["waiting_for_comment"] = False
-
-        # Show updated summary
-        summary = (
-            f"{tr(context, 'order_summary_title')}"
-            f"{tr(context, 'name_label')}: {context.user_data['name']}\n"
-            f"{tr(context, 'phone_label')}: {context.user_data['phone']}\n"
-            f"{tr(context, 'pickup_label')}: {context.user_data['pickup']}\n"
-            f"{tr(context, 'dropoff_label')}: {context.user_data['dropoff']}\n"
-            f"{tr(context, 'comment_label')}: {context.user_data['comment']}\n"
-        )
-
-        keyboard = [[InlineKeyboardButton(tr(context, "confirm_button"), callback_data="confirm")]]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        await update.message.reply_text(summary, reply_markup=reply_markup)
+    order = current_order(context)
+    if order.waiting_for_comment:
+        order.comment = update.message.text
+        order.waiting_for_comment = False
+
+        # Turn the comment prompt back into the updated summary rather than sending a second one
+        summary = render_summary(context)
+        if order.summary_message_id is not None:
+            try:
+                await context.bot.edit_message_text(
+                    chat_id=update.effective_chat.id,
+                    message_id=order.summary_message_id,
+                    text=summary,
+                    reply_markup=markup(context, "confirm"),
+                )
+                return CONFIRM
+            except BadRequest as e:
+                # e.g. the message was deleted or is too old to edit: send the summary as a new message
+                logger.warning("Failed to edit order summary: %s", e)
+        await update.message.reply_text(summary, reply_markup=markup(context, "confirm"))
     return CONFIRM
 
 
 async def confirm_order(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Send order to drivers"""
     query = update.callback_query
-    await query.answer()
+    # Take the order out of user_data before the first await: updates run concurrently, so a double
+    # tap on Confirm runs this handler twice and only the call that got the order may deliver it
+    order = context.user_data.pop("order", None)
+    try:
+        await query.answer()
+    except TelegramError as e:
+        # best-effort: e.g. "query is too old" when a callback is replayed after a restart
+        logger.warning("Failed to answer confirm callback: %s", e)
+    if order is None:
+        return ConversationHandler.END
 
     # Prepare order message for drivers (use customer's selected language where possible)
     customer_username = update.effective_user.username
-    customer_name = context.user_data.get("name", "Unknown")
-
-    order_lines = [
-        "🚖 NEW ORDER",
-        "",
-        f"{tr(context, 'name_label')}: {context.user_data.get('name','')}",
-        f"{tr(context, 'phone_label')}: {context.user_data.get('phone','')}",
-        f"{tr(context, 'pickup_label')}: {context.user_data.get('pickup','')}",
-        f"{tr(context, 'dropoff_label')}: {context.user_data.get('dropoff','')}",
-    ]
-    if context.user_data.get("comment"):
-        order_lines.append(f"{tr(context, 'comment_label')}: {context.user_data['comment']}")
-
-    order_lines.append("")  # spacer
-    order_lines.append(f"{tr(context, 'waze_label')}: {context.user_data.get('waze_link','')}")
+    customer_name = order.name or "Unknown"
 
+    fields = order_fields(context, order)
     # Contact line: prefer username, fall back to phone
     if customer_username:
-        order_lines.append(f"{tr(context, 'contact_username', username=customer_username)}")
+        fields["contact_line"] = tr(context, "contact_username", username=customer_username)
     else:
-        phone = context.user_data.get("phone", "(no phone)")
-        order_lines.append(tr(context, "contact_phone", phone=phone))
-
-    order_message = "\n".join(order_lines)
+        fields["contact_line"] = tr(context, "contact_phone", phone=order.phone or "(no phone)")
+    lang = context.user_data.get("lang", "en")
+    order_message = ORDER_TEMPLATES.get(lang, ORDER_TEMPLATES["en"]).format_map(fields)
 
     # If no drivers are registered, notify admin and the passenger
     if not driver_chat_ids:
@@ -360,62 +807,74 @@ async def confirm_order(update: Update, context: ContextTypes.DEFAULT_TYPE):
                     text=tr(context, "no_drivers_admin", customer=customer_name),
                 )
             except Exception as e:
-                logger.error(f"Failed to notify admin about missing drivers: {e}")
+                logger.error("Failed to notify admin about missing drivers: %s", e)
         # preserve language, clear other user data, and show short prompt + start button
-        lang = context.user_data.get("lang", "en")
-        context.user_data.clear()
-        context.user_data["lang"] = lang
-
-        order_btn = tr(context, "order_button")
-        keyboard = [[KeyboardButton(order_btn)]]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-
+        reset_order(context)
         await query.edit_message_text(tr(context, "no_drivers_passenger"))
-        await context.bot.send_message(
-            chat_id=update.effective_chat.id, text=tr(context, "start_again"), reply_markup=reply_markup
-        )
+        await send_start_again(update.effective_chat.id, context)
         return ConversationHandler.END
 
-    # Send to all drivers
-    if not DRIVER_BOT_TOKEN:
-        logger.error("DRIVER_BOT_TOKEN not set. Cannot forward order to drivers.")
-    driver_bot = Bot(token=DRIVER_BOT_TOKEN) if DRIVER_BOT_TOKEN else context.bot
+    # Send to all drivers through the shared driver bot created in main()
+    driver_bot = context.bot_data["driver_bot"]
+    targets = sorted(driver_chat_ids)
 
-    failed_deliveries = []
-    logger.info(f"Attempting to deliver order to drivers: {driver_chat_ids}")
-    for driver_id in driver_chat_ids:
-        try:
-            await driver_bot.send_message(chat_id=driver_id, text=order_message)
-            logger.info(f"Order sent to driver {driver_id}")
-        except Exception as e:
-            logger.error(f"Failed to send to driver {driver_id}: {e}")
-            failed_deliveries.append(driver_id)
-
-    # Notify admin if any failures
-    if failed_deliveries:
-        try:
-            admin_message = tr(
-                context, "order_delivery_failed", customer=(customer_username or customer_name), count=len(failed_deliveries)
+    async def send_to_driver(driver_id: int):
+        """Send the order to one driver; return the driver id on failure, None on success"""
+        for attempt in range(1, DRIVER_SEND_ATTEMPTS + 1):
+            try:
+                async with driver_send_semaphore:
+                    # No link preview: Telegram would otherwise fetch the Waze page once per driver
+                    await driver_bot.send_message(chat_id=driver_id, text=order_message, disable_web_page_preview=True)
+                logger.info("Order sent to driver %s", driver_id)
+                return None
+            except RetryAfter as e:
+                delay = e.retry_after + 0.1
+            except BadRequest as e:
+                # BadRequest subclasses NetworkError but retrying cannot fix it
+                logger.error("Failed to send to driver %s: %s", driver_id, e)
+                return driver_id
+            except NetworkError:
+                # includes TimedOut
+                delay = 0.5
+            except Exception as e:
+                logger.error("Failed to send to driver %s: %s", driver_id, e)
+                return driver_id
+            if attempt < DRIVER_SEND_ATTEMPTS:
+                logger.warning("Sending to driver %s failed (attempt %s), retrying in %ss", driver_id, attempt, delay)
+                # sleep outside the semaphore so other sends can use the slot
+                await asyncio.sleep(delay)
+        logger.error("Failed to send to driver %s after %s attempts", driver_id, DRIVER_SEND_ATTEMPTS)
+        return driver_id
+
+    async def deliver_order():
+        """Fan the order out to all drivers and notify admin about failures"""
+        logger.info("Attempting to deliver order to drivers: %s", targets)
+        results = await asyncio.gather(*[send_to_driver(driver_id) for driver_id in targets])
+        failed_deliveries = [driver_id for driver_id in results if driver_id is not None]
+
+        # Queue a report for admin if any failures (sent in batches by flush_admin_reports)
+        if failed_deliveries:
+            context.bot_data["admin_pending"].append(
+                tr(
+                    context,
+                    "order_delivery_failed",
+                    customer=(customer_username or customer_name),
+                    count=len(failed_deliveries),
+                )
             )
-            if "admin_chat_id" in context.bot_data:
-                await context.bot.send_message(chat_id=context.bot_data["admin_chat_id"], text=admin_message)
-        except Exception as e:
-            logger.error(f"Failed to notify admin: {e}")
 
-    # preserve language so start_again is shown in the same language
-    lang = context.user_data.get("lang", "en")
+    # Deliver in the background so the passenger gets the confirmation without waiting on drivers
+    context.application.create_task(deliver_order(), update=update)
+
     # Send only one final confirmation text (edited inline message) to avoid duplication
-    await query.edit_message_text(TRANSLATIONS.get(lang, TRANSLATIONS["en"])["order_accepted"])
+    await query.edit_message_text(tr(context, "order_accepted"))
 
     # Clear user data but keep language
-    context.user_data.clear()
-    context.user_data["lang"] = lang
+    reset_order(context)
 
-    # Show start button again with a short prompt (no duplicate confirmation) in user's language
-    order_btn = tr(context, "order_button")
-    keyboard = [[KeyboardButton(order_btn)]]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-    await context.bot.send_message(chat_id=update.effective_chat.id, text=tr(context, "start_again"), reply_markup=reply_markup)
+    # Show start button again with a short prompt (no duplicate confirmation) in user's language.
+    # Fire-and-forget: the conversation can end without waiting for this round trip
+    context.application.create_task(send_start_again(update.effective_chat.id, context), update=update)
 
     return ConversationHandler.END
 
@@ -423,27 +882,33 @@ async def confirm_order(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Cancel the conversation"""
     # preserve language when cancelling
-    lang = context.user_data.get("lang", "en")
-    context.user_data.clear()
-    context.user_data["lang"] = lang
-
-    order_btn = tr(context, "order_button")
-    keyboard = [[KeyboardButton(order_btn)]]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-
-    await update.message.reply_text(tr(context, "cancelled"), reply_markup=reply_markup)
+    reset_order(context)
+    await send_start_again(update.effective_chat.id, context, "cancelled")
     return ConversationHandler.END
 
 
 # Admin commands (kept in default/english messages handled via tr where appropriate)
+def admin_only(handler):
+    """Reply with not_authorized unless the sender is one of ADMINS"""
+
+    @functools.wraps(handler)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        if (update.effective_user.username or "").lower() not in ADMINS:
+            await update.message.reply_text(TRANSLATIONS["en"]["not_authorized"])
+            return
+        return await handler(update, context)
+
+    return wrapper
+
+
+@admin_only
 async def add_driver(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Add driver chat ID (admin only)"""
-    if update.effective_user.username != ADMIN_USERNAME:
-        await update.message.reply_text(TRANSLATIONS["en"]["not_authorized"])
-        return
-
+    global drivers_list_cache
     # Store admin chat ID for notifications
-    context.bot_data["admin_chat_id"] = update.effective_chat.id
+    if context.bot_data.get("admin_chat_id") != update.effective_chat.id:
+        context.bot_data["admin_chat_id"] = update.effective_chat.id
+        await store_admin_chat_id(update.effective_chat.id)
 
     if not context.args or len(context.args) != 1:
         await update.message.reply_text(TRANSLATIONS["en"]["add_driver_usage"])
@@ -451,53 +916,135 @@ async def add_driver(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     try:
         chat_id = int(context.args[0])
-        if chat_id not in driver_chat_ids:
-            driver_chat_ids.append(chat_id)
-            save_driver_ids(driver_chat_ids)
-            await update.message.reply_text(
-                TRANSLATIONS["en"]["driver_added"].format(chat_id=chat_id, count=len(driver_chat_ids))
-            )
-        else:
-            await update.message.reply_text(TRANSLATIONS["en"]["driver_exists"].format(chat_id=chat_id))
+        async with driver_ids_lock:
+            if chat_id not in driver_chat_ids:
+                driver_chat_ids.add(chat_id)
+                drivers_list_cache = None
+                await store_driver_id(chat_id)
+                await update.message.reply_text(
+                    TRANSLATIONS["en"]["driver_added"].format(chat_id=chat_id, count=len(driver_chat_ids))
+                )
+            else:
+                await update.message.reply_text(TRANSLATIONS["en"]["driver_exists"].format(chat_id=chat_id))
     except ValueError:
         await update.message.reply_text(TRANSLATIONS["en"]["invalid_chat_id"])
 
 
+@admin_only
 async def remove_driver(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Remove driver chat ID (admin only)"""
-    if update.effective_user.username != ADMIN_USERNAME:
-        await update.message.reply_text(TRANSLATIONS["en"]["not_authorized"])
-        return
-
+    global drivers_list_cache
     if not context.args or len(context.args) != 1:
         await update.message.reply_text(TRANSLATIONS["en"]["remove_driver_usage"])
         return
 
     try:
         chat_id = int(context.args[0])
-        if chat_id in driver_chat_ids:
-            driver_chat_ids.remove(chat_id)
-            save_driver_ids(driver_chat_ids)
-            await update.message.reply_text(
-                TRANSLATIONS["en"]["driver_removed"].format(chat_id=chat_id, count=len(driver_chat_ids))
-            )
-        else:
-            await update.message.reply_text(TRANSLATIONS["en"]["driver_not_found"].format(chat_id=chat_id))
+        async with driver_ids_lock:
+            if chat_id in driver_chat_ids:
+                driver_chat_ids.remove(chat_id)
+                drivers_list_cache = None
+                await drop_driver_id(chat_id)
+                await update.message.reply_text(
+                    TRANSLATIONS["en"]["driver_removed"].format(chat_id=chat_id, count=len(driver_chat_ids))
+                )
+            else:
+                await update.message.reply_text(TRANSLATIONS["en"]["driver_not_found"].format(chat_id=chat_id))
     except ValueError:
         await update.message.reply_text(TRANSLATIONS["en"]["invalid_chat_id"])
 
 
+@admin_only
 async def list_drivers(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """List all drivers (admin only)"""
-    if update.effective_user.username != ADMIN_USERNAME:
-        await update.message.reply_text(TRANSLATIONS["en"]["not_authorized"])
-        return
-
     if not driver_chat_ids:
         await update.message.reply_text(TRANSLATIONS["en"]["no_drivers_registered"])
     else:
-        drivers_list = "\n".join([f"• {chat_id}" for chat_id in driver_chat_ids])
-        await update.message.reply_text(TRANSLATIONS["en"]["drivers_list"].format(count=len(driver_chat_ids), list=drivers_list))
+        await update.message.reply_text(
+            TRANSLATIONS["en"]["drivers_list"].format(count=len(driver_chat_ids), list=drivers_list_text())
+        )
+
+
+# Delivery-failure reports are collected for this long and sent to admin together
+ADMIN_REPORT_INTERVAL = 1.0
+
+
+async def flush_admin_reports(application: Application):
+    """Periodically send all queued delivery-failure reports to admin, batched into as few messages as possible"""
+    pending = application.bot_data["admin_pending"]
+    while True:
+        await asyncio.sleep(ADMIN_REPORT_INTERVAL)
+        if not pending:
+            continue
+        reports = pending[:]
+        pending.clear()
+        admin_chat = application.bot_data.get("admin_chat_id")
+        if not admin_chat:
+            continue
+        # Pack the reports into as few messages as Telegram's text length limit allows
+        messages = []
+        for report in reports:
+            if messages and len(messages[-1]) + 2 + len(report) <= MessageLimit.MAX_TEXT_LENGTH:
+                messages[-1] += "\n\n" + report
+            else:
+                messages.append(report[: MessageLimit.MAX_TEXT_LENGTH])
+        for text in messages:
+            try:
+                await application.bot.send_message(chat_id=admin_chat, text=text)
+            except Exception as e:
+                logger.error("Failed to notify admin: %s", e)
+
+
+async def post_init(application: Application):
+    """Open the driver bot's connection pool once at startup and load drivers and admin chat from Redis"""
+    if redis_client is not None:
+        try:
+            # First start with Redis: carry over the drivers registered in the local database
+            if await redis_client.set(REDIS_DRIVERS_MIGRATED_KEY, 1, nx=True):
+                if driver_chat_ids and not await redis_client.exists(REDIS_DRIVERS_KEY):
+                    await redis_client.sadd(REDIS_DRIVERS_KEY, *driver_chat_ids)
+        except Exception as e:
+            logger.error("Failed to copy driver ids to Redis: %s", e)
+        await load_redis_driver_ids()
+        try:
+            admin_chat = await redis_client.get(REDIS_ADMIN_CHAT_KEY)
+            if admin_chat is not None:
+                application.bot_data["admin_chat_id"] = int(admin_chat)
+        except Exception as e:
+            logger.error("Failed to load admin chat id from Redis: %s", e)
+
+    # Not Application.create_task: the loop never finishes, so it is cancelled in post_shutdown instead
+    application.bot_data["admin_pending"] = []
+    application.bot_data["admin_report_task"] = asyncio.create_task(flush_admin_reports(application))
+
+    driver_bot = application.bot_data["driver_bot"]
+    if driver_bot is not application.bot:
+        try:
+            await driver_bot.initialize()
+        except Exception as e:
+            logger.error("Failed to initialize driver bot: %s", e)
+
+
+async def post_shutdown(application: Application):
+    """Stop admin reporting and close the driver bot's connection pool and the Redis connection"""
+    application.bot_data["admin_report_task"].cancel()
+    driver_bot = application.bot_data["driver_bot"]
+    if driver_bot is not application.bot:
+        await driver_bot.shutdown()
+    if redis_client is not None:
+        await redis_client.aclose()
+
+
+class FastJSONRequest(HTTPXRequest):
+    """HTTPXRequest that parses Telegram responses with orjson"""
+
+    @staticmethod
+    def parse_json_payload(payload: bytes) -> dict:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # PTB's stdlib path logs the bad payload and raises TelegramError
+            return HTTPXRequest.parse_json_payload(payload)
 
 
 def main():
@@ -505,17 +1052,43 @@ def main():
     if not PASSENGER_BOT_TOKEN:
         logger.error("PASSENGER_BOT_TOKEN not set. Exiting.")
         return
-    # DRIVER_BOT_TOKEN is optional: if missing we attempt to send via passenger bot API object
-    application = Application.builder().token(PASSENGER_BOT_TOKEN).build()
+    builder = (
+        Application.builder()
+        .token(PASSENGER_BOT_TOKEN)
+        .request(FastJSONRequest(connection_pool_size=256))
+        .get_updates_request(FastJSONRequest())
+        .concurrent_updates(True)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+    )
+    if redis_client is not None:
+        builder = builder.persistence(RedisPersistence(redis_client))
+    else:
+        builder = builder.persistence(ThreadedPicklePersistence(PERSISTENCE_FILE))
+    application = builder.build()
+
+    # One driver bot (and HTTP connection pool) reused for every order.
+    # DRIVER_BOT_TOKEN is optional: if missing we send via the passenger bot API object
+    if DRIVER_BOT_TOKEN:
+        # HTTP/2 multiplexes the concurrent order sends over one TLS connection
+        driver_request = FastJSONRequest(connection_pool_size=64, http_version="2", read_timeout=10, pool_timeout=5.0)
+        # Token bucket keeps large fan-outs under the per-bot limit; retries are handled in send_to_driver
+        driver_rate_limiter = AIORateLimiter(overall_max_rate=DRIVER_SEND_RATE, overall_time_period=1)
+        application.bot_data["driver_bot"] = ExtBot(
+            token=DRIVER_BOT_TOKEN, request=driver_request, rate_limiter=driver_rate_limiter
+        )
+    else:
+        logger.error("DRIVER_BOT_TOKEN not set. Orders will be sent via the passenger bot.")
+        application.bot_data["driver_bot"] = application.bot
 
     # Conversation handler for ordering
     conv_handler = ConversationHandler(
         entry_points=[
             CommandHandler("start", start),
-            # language selection (flag buttons)
-            MessageHandler(filters.Regex(f"^{LANG_UK}$") | filters.Regex(f"^{LANG_EN}$"), language_select),
-            # order buttons (both languages)
-            MessageHandler(filters.Regex(r"^🚖 Order Taxi$") | filters.Regex(r"^🚖 Замовити таксі$"), order_taxi),
+            # language selection (flag buttons); one exact-text filter instead of two regexes
+            MessageHandler(filters.Text([LANG_UK, LANG_EN]), language_select),
+            # order buttons (both languages); exact-text match, no regex
+            MessageHandler(filters.Text(ORDER_BUTTON_TEXTS), order_taxi),
         ],
         states={
             NAME: [MessageHandler(filters.TEXT & ~filters.COMMAND, get_name)],
@@ -535,6 +1108,8 @@ def main():
             ],
         },
         fallbacks=[CommandHandler("cancel", cancel)],
+        name="order_conversation",
+        persistent=True,
     )
 
     application.add_handler(conv_handler)
@@ -545,8 +1120,18 @@ def main():
     application.add_handler(CommandHandler("list_drivers", list_drivers))
 
     # Start the bot
-    logger.info("Passenger bot started...")
-    application.run_polling(allowed_updates=Update.ALL_TYPES)
+    if WEBHOOK_HOST:
+        logger.info("Passenger bot started (webhook on port %s)...", PORT)
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=PORT,
+            url_path=PASSENGER_BOT_TOKEN,
+            webhook_url=f"https://{WEBHOOK_HOST}/{PASSENGER_BOT_TOKEN}",
+            allowed_updates=ALLOWED_UPDATES,
+        )
+    else:
+        logger.info("Passenger bot started (polling)...")
+        application.run_polling(allowed_updates=ALLOWED_UPDATES)
 
 
 if __name__ == "__main__":